@@ -1,142 +1,291 @@
+import sys
 import time
 import logging
+import argparse
+import functools
+import re
 from PyATEMMax import ATEMMax
 import socket
+import selectors
 import threading
-from PyQt6.QtCore import QThread, pyqtSignal, Qt
+from PyQt6.QtCore import QThread, QTimer, pyqtSignal, Qt
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout, QHBoxLayout, QLabel, QLineEdit, QPushButton, QFileDialog, QMessageBox, QGroupBox, QListWidget, QTableWidget, QTableWidgetItem, QFrame, QCheckBox
 from PyQt6.QtGui import QColor, QFont
 
-# Basic logging configuration
-logging.basicConfig(level=logging.DEBUG)
+# Basic logging configuration (use --debug for verbose output)
+logging.basicConfig(level=logging.INFO)
 log = logging.getLogger("ATEMLogger")
 
+# Readiness selector for the (single) HyperDeck connection
+_hyperdeck_selector = selectors.DefaultSelector()
+# Requests sent on that connection whose response hasn't been read yet, and
+# bytes of those responses already received at the start of the caller's buffer
+_hyperdeck_unanswered = 0
+_hyperdeck_buffered = 0
+
+# EDL layout: header and per-clip event (unique ID, source/record in and out, clip name)
+EDL_HEADER = b"TITLE: ATEM Program Output\nFCM: NON-DROP FRAME\n"
+EDL_EVENT_TEMPLATE = b"%04d  AX    V     C   %s %s %s %s\n* FROM CLIP NAME: %s\n"
+# Dotted-quad IPv4 address without leading zeros, which resolvers read as
+# octal (range of each octet checked separately)
+_IP_RE = re.compile(r"(?:(?:0|[1-9][0-9]{0,2})\.){3}(?:0|[1-9][0-9]{0,2})")
+# Frame rate used for timecode arithmetic
+FPS = 25
+# Upper bound (in seconds) for a single HyperDeck request/response exchange
+HYPERDECK_TIMEOUT = 0.5
+# Size of the reusable receive buffer for HyperDeck responses
+HYPERDECK_BUFFER_SIZE = 1024
+# Field of the "transport info" response holding the timecode
+DISPLAY_TIMECODE_PREFIX = b"display timecode:"
+# Refresh interval (in milliseconds) of the timecode display
+TIMECODE_REFRESH_INTERVAL = 50
+# Delay (in milliseconds) used to batch new rows into the log table
+LOG_FLUSH_INTERVAL = 250
+# Maximum time (in seconds) the monitor waits for a program change between timecode polls
+POLL_INTERVAL = 0.01
+
 # Function to generate an EDL file with unique identifiers for each clip
-def generate_edl(clips, file_path, compensation_frames=0):
-    if not clips:
+# Clips are given as parallel sequences: start and end timecodes as received
+# from the HyperDeck, their frame counts (None if unparsable) and sources
+def generate_edl(starts, ends, start_frames, end_frames, srcs, file_path, compensation_frames=0):
+    if not srcs:
         log.warning("No cuts detected, no data to save in the EDL.")
         return
-    
-    with open(file_path, 'w') as edl_file:
-        # EDL header
-        edl_file.write("TITLE: ATEM Program Output\n")
-        edl_file.write("FCM: NON-DROP FRAME\n")
-        
-        for i, clip in enumerate(clips):
-            start_timecode = clip['start']
-            end_timecode = clip['end']
 
-            # If compensation is enabled, adjust the timecode
-            if compensation_frames > 0:
-                start_timecode = adjust_timecode(start_timecode, compensation_frames)
-                end_timecode = adjust_timecode(end_timecode, compensation_frames)
-
-            # Generate a unique ID for each clip
-            clip_id = f"{i+1:04}"
-            edl_file.write(f"{clip_id}  AX    V     C   {start_timecode} {end_timecode} {start_timecode} {end_timecode}\n")
-            edl_file.write(f"* FROM CLIP NAME: {clip['src']}\n")
+    # The EDL is built as ASCII bytes; each distinct source name is encoded once
+    src_names = {src: str(src).encode('ascii', 'replace') for src in set(srcs)}
+
+    if compensation_frames:
+        # Frame arithmetic only when compensating; unparsable timecodes are kept as received
+        def edl_timecode(timecode, frames):
+            if frames is None:
+                return timecode.encode('ascii', 'replace')
+            return adjust_timecode(frames, compensation_frames)
+    else:
+        # Without compensation the HyperDeck timecode is written unchanged
+        def edl_timecode(timecode, frames):
+            return timecode.encode('ascii', 'replace')
+
+    # EDL header followed by one fixed-form event per clip
+    lines = [EDL_HEADER]
+    lines_append = lines.append
+    for i, (start, end, start_f, end_f, src) in enumerate(zip(starts, ends, start_frames, end_frames, srcs), 1):
+        start_timecode = edl_timecode(start, start_f)
+        end_timecode = edl_timecode(end, end_f)
+        lines_append(EDL_EVENT_TEMPLATE % (i, start_timecode, end_timecode, start_timecode, end_timecode, src_names[src]))
+
+    with open(file_path, 'wb') as edl_file:
+        edl_file.write(b"".join(lines))
 
     log.info(f"EDL file successfully generated: {file_path}")
 
-def adjust_timecode(timecode, compensation_frames):
+def timecode_to_frames(timecode, fps=FPS):
     """
-    Adjusts the timecode by adding the compensation for frames.
+    Converts a "HH:MM:SS:FF" timecode into a total frame count.
     """
-    try:
-        hours, minutes, seconds, frames = map(int, timecode.split(':'))
-        frames += compensation_frames
-        
-        # Handle frame overflow
-        if frames >= 25:  # Assumption: 25 frames per second
-            frames -= 25
-            seconds += 1
+    hours, minutes, seconds, frames = map(int, timecode.split(':'))
+    return ((hours * 60 + minutes) * 60 + seconds) * fps + frames
 
-        # Handle second overflow
-        if seconds >= 60:
-            seconds -= 60
-            minutes += 1
-
-        # Handle minute overflow
-        if minutes >= 60:
-            minutes -= 60
-            hours += 1
-
-        # Format the adjusted timecode
-        return f"{hours:02}:{minutes:02}:{seconds:02}:{frames:02}"
+def parse_timecode(timecode, fps=FPS):
+    """
+    Converts a timecode into a total frame count, or returns None if it
+    is not in the "HH:MM:SS:FF" form (e.g. drop-frame "HH:MM:SS;FF").
+    """
+    try:
+        return timecode_to_frames(timecode, fps)
+    except ValueError:
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Unsupported timecode format: {timecode}")
+        return None
 
-    except Exception as e:
-        log.error(f"Error while adjusting the timecode: {e}")
-        return timecode  # Return the original timecode in case of an error
+def adjust_timecode(total_frames, compensation_frames, fps=FPS):
+    """
+    Adds the compensation to a frame count and formats it as an ASCII
+    timecode (bytes, ready for the EDL). Any offset is normalized in one
+    pass, wrapping around at 24 hours.
+    """
+    total = total_frames + compensation_frames
+    frames, total = total % fps, total // fps
+    seconds, total = total % 60, total // 60
+    minutes, hours = total % 60, (total // 60) % 24
+    return b"%02d:%02d:%02d:%02d" % (hours, minutes, seconds, frames)
 
 def connect_to_hyperdeck(ip, port=9993):
+    global _hyperdeck_unanswered, _hyperdeck_buffered
     try:
         s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        # Small request/response traffic: send immediately, keep the link monitored
+        s.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 65536)
+        s.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
         s.connect((ip, port))
+        s.settimeout(HYPERDECK_TIMEOUT)
         # Read the initial response
-        initial_response = s.recv(1024).decode('utf-8')
-        print("Initial response from HyperDeck:", initial_response)
+        initial_response = s.recv(1024)
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug(f"Initial response from HyperDeck: {initial_response.decode('utf-8')}")
+        # Further exchanges are non-blocking and bounded by the selector
+        s.setblocking(False)
+        _hyperdeck_selector.register(s, selectors.EVENT_READ)
+        _hyperdeck_unanswered = _hyperdeck_buffered = 0
         return s
     except Exception as e:
         log.error(f"Error connecting to HyperDeck: {e}")
         return None
 
-def get_timecode_from_hyperdeck(socket_conn):
+def close_hyperdeck(socket_conn):
+    _hyperdeck_selector.unregister(socket_conn)
+    socket_conn.close()
+
+def hyperdeck_response_end(buffer, size):
+    """
+    Returns the offset just past the first full response held in the first
+    `size` bytes of `buffer`, or -1 if it is still incomplete.
+    Multi-line responses (status line ending with ":") are terminated by a
+    blank line, single-line responses by the first line break.
+    """
+    end_of_status = buffer.find(b"\n", 0, size)
+    if end_of_status < 0:
+        return -1
+    if not buffer[:end_of_status].rstrip().endswith(b":"):
+        return end_of_status + 1
+    ends = [end + length
+            for end, length in ((buffer.find(b"\n\r\n", end_of_status, size), 3),
+                                (buffer.find(b"\n\n", end_of_status, size), 2))
+            if end >= 0]
+    return min(ends) if ends else -1
+
+def get_timecode_from_hyperdeck(socket_conn, buffer):
     """
     Sends the "transport info" command and retrieves the "Display Timecode".
+    The response is received into the caller-owned `buffer` (a bytearray),
+    which is reused across calls.
+    Responses to earlier requests that timed out are still on their way;
+    they are skipped so the reply read here always matches this request.
+    Bytes received past a response are kept at the start of `buffer` for
+    the next call.
     """
+    global _hyperdeck_unanswered, _hyperdeck_buffered
     try:
         # Send the "transport info" command
         socket_conn.sendall(b"transport info\n")
+        _hyperdeck_unanswered += 1
         
-        response = b""
-        while True:
-            chunk = socket_conn.recv(1024)
-            response += chunk
-            if not chunk or b"\n" in chunk:
-                break
-
-        # Decode and analyze the response
-        response_str = response.decode("utf-8")
-        print(f"Response received from HyperDeck: {response_str}")
-
-        # Check and return the "display timecode"
-        for line in response_str.split("\n"):
-            if line.startswith("display timecode:"):
-                return line.split("display timecode:")[1].strip()
-
-        # If no display timecode is found, display an error message
-        if "status:" in response_str:
-            status = response_str.split("status:")[1].strip()
-            print(f"Transport status: {status}")
-            if "recording" in status:
-                print("Recording in progress, displaying timecode.")
-            else:
-                print("HyperDeck in an unknown state or no timecode information.")
+        deadline = time.monotonic() + HYPERDECK_TIMEOUT
+        size = _hyperdeck_buffered
+        with memoryview(buffer) as view:
+            while True:
+                end = hyperdeck_response_end(buffer, size)
+                if end >= 0:
+                    _hyperdeck_unanswered -= 1
+                    if not _hyperdeck_unanswered:
+                        break
+                    # Late reply to a timed out request: drop it and keep reading
+                    buffer[:size - end] = buffer[end:size]
+                    size -= end
+                    continue
+                if size == len(buffer):
+                    # Oversized response: parse what fits and start over in sync
+                    _hyperdeck_unanswered = 0
+                    end = size
+                    break
+                # Never let a missing reply stall the monitoring loop
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not _hyperdeck_selector.select(remaining):
+                    _hyperdeck_buffered = size
+                    raise TimeoutError("timed out")
+                received = socket_conn.recv_into(view[size:])
+                if not received:
+                    end = size
+                    break
+                size += received
+
+        timecode = None
+        # Check the "display timecode", decoding only its value
+        start = buffer.find(DISPLAY_TIMECODE_PREFIX, 0, end)
+        if start >= 0:
+            start += len(DISPLAY_TIMECODE_PREFIX)
+            line_end = buffer.find(b"\n", start, end)
+            timecode = buffer[start:line_end if line_end >= 0 else end].strip().decode("ascii")
+
+        # If no display timecode is found, report the transport status
+        elif log.isEnabledFor(logging.DEBUG):
+            response_str = buffer[:end].decode("utf-8")
+            if "status:" in response_str:
+                status = response_str.split("status:")[1].strip()
+                log.debug(f"Transport status: {status}")
+                if "recording" in status:
+                    log.debug("Recording in progress, displaying timecode.")
+                else:
+                    log.debug("HyperDeck in an unknown state or no timecode information.")
+
+        # Keep whatever follows this response for the next call
+        if size > end:
+            buffer[:size - end] = buffer[end:size]
+        _hyperdeck_buffered = size - end
+        return timecode
 
     except Exception as e:
         log.error(f"Error retrieving timecode: {e}")
     
     return None
 
+@functools.lru_cache(maxsize=None)
+def input_names(video_sources):
+    """
+    Returns the names of the physical inputs ("input1", ...) of a PyATEMMax
+    video source list, in protocol order. The list is static, so the result
+    is computed once.
+    """
+    names = (source.name for source in video_sources)
+    return tuple(name for name in names if name.lower()[:5] == 'input')
+
 class ATEMMonitorThread(QThread):
     update_input_signal = pyqtSignal(str)
     update_log_signal = pyqtSignal(str, str, str)
-    update_timecode_signal = pyqtSignal(str)
 
-    def __init__(self, atem_ip, hyperdeck_ip, stop_event, start_time, file_path, compensation_frames):
+    def __init__(self, atem_ip, hyperdeck_ip, stop_event, start_time, file_path, compensation_frames, atem=None):
         super().__init__()
         self.atem_ip = atem_ip
+        # Switcher connection shared by the GUI; a private one is created if None
+        self.atem = atem
         self.hyperdeck_ip = hyperdeck_ip
         self.stop_event = stop_event
         self.start_time = start_time
         self.file_path = file_path
         self.compensation_frames = compensation_frames
         self.hyperdeck_conn = None
+        # Latest HyperDeck timecode, read periodically by the GUI thread
+        self.latest_timecode = None
+        self.hyperdeck_buffer = bytearray(HYPERDECK_BUFFER_SIZE)
+        self.input_changed = threading.Event()
+
+    def on_atem_receive(self, params):
+        """
+        PyATEMMax event handler: wakes up the monitoring loop as soon as
+        the switcher reports a program input change.
+        """
+        if params["cmd"] == "PrgI":
+            self.input_changed.set()
+
+    def stop(self):
+        """
+        Requests the monitoring loop to end, interrupting its current wait.
+        """
+        self.stop_event.set()
+        self.input_changed.set()
 
     def run(self):
-        atem = ATEMMax()
+        owns_atem = self.atem is None
+        if owns_atem:
+            atem = ATEMMax()
+            atem.registerEvent(atem.atem.events.receive, self.on_atem_receive)
+        else:
+            atem = self.atem
         try:
-            atem.connect(self.atem_ip)
+            # Reuse the existing switcher session instead of redoing the handshake
+            if not (atem.connected and atem.ip == self.atem_ip):
+                atem.connect(self.atem_ip)
         except Exception as e:
             log.error(f"Error connecting to ATEM: {e}")
             self.stop_event.set()
@@ -150,53 +299,75 @@ class ATEMMonitorThread(QThread):
 
         last_program_input = None
         last_timecode = None
-        clips = []
+        last_timecode_frames = None
+        timecode = None
+        # Clips as parallel lists: start/end timecodes, their frame counts, source
+        clip_starts, clip_ends, clip_srcs = [], [], []
+        clip_start_frames, clip_end_frames = [], []
+
+        # Bind loop invariants once instead of resolving them on every poll
+        program_inputs = atem.programInput
+        mix_effect = atem.atem.mixEffects.mixEffect1
+        is_stopped = self.stop_event.is_set
+        input_changed = self.input_changed
+        emit_input = self.update_input_signal.emit
+        hyperdeck_conn = self.hyperdeck_conn
+        hyperdeck_buffer = self.hyperdeck_buffer
+        # Frame counts are only needed to apply the compensation in the EDL
+        compensating = bool(self.compensation_frames)
 
         try:
-            while not self.stop_event.is_set():
+            while not is_stopped():
                 try:
-                    program_input = atem.programInput[atem.atem.mixEffects.mixEffect1].videoSource
-                    program_input_str = str(program_input) if not isinstance(program_input, str) else program_input
-
-                    self.update_input_signal.emit(program_input_str)
+                    input_changed.clear()
+                    program_input = program_inputs[mix_effect].videoSource
 
-                    timecode = get_timecode_from_hyperdeck(self.hyperdeck_conn)
+                    timecode = get_timecode_from_hyperdeck(hyperdeck_conn, hyperdeck_buffer)
                     if timecode:
-                        self.update_timecode_signal.emit(timecode)
+                        # Plain reference assignment, picked up by the GUI refresh timer
+                        self.latest_timecode = timecode
 
                     if program_input != last_program_input:
-                        if last_program_input is not None and last_timecode:
-                            clips.append({
-                                'start': last_timecode,
-                                'end': timecode,
-                                'src': last_program_input
-                            })
+                        program_input_str = str(program_input) if not isinstance(program_input, str) else program_input
+                        emit_input(program_input_str)
+                        # Parsed at cut boundaries only; None when it can't be parsed
+                        timecode_frames = parse_timecode(timecode) if compensating and timecode else None
+                        if last_program_input is not None and last_timecode and timecode:
+                            clip_starts.append(last_timecode)
+                            clip_ends.append(timecode)
+                            clip_start_frames.append(last_timecode_frames)
+                            clip_end_frames.append(timecode_frames)
+                            clip_srcs.append(last_program_input)
                             self.update_log_signal.emit(str(last_program_input), last_timecode, timecode)
                         last_program_input = program_input
                         last_timecode = timecode
+                        last_timecode_frames = timecode_frames
                         log.info(f"Program input at {timecode}: {program_input_str}")
-                    else:
-                        time.sleep(0.01)
+                    elif not is_stopped():
+                        # Sleep until the switcher reports a cut, a stop is requested or the poll interval elapses
+                        input_changed.wait(POLL_INTERVAL)
                 except Exception as e:
                     log.error(f"Error retrieving program input: {e}")
 
-            if last_program_input is not None and last_timecode:
-                clips.append({
-                    'start': last_timecode,
-                    'end': timecode,
-                    'src': last_program_input
-                })
+            if last_program_input is not None and last_timecode and timecode:
+                clip_starts.append(last_timecode)
+                clip_ends.append(timecode)
+                clip_start_frames.append(last_timecode_frames)
+                clip_end_frames.append(parse_timecode(timecode) if compensating else None)
+                clip_srcs.append(last_program_input)
 
-            if self.file_path and clips:
-                generate_edl(clips, self.file_path, self.compensation_frames)
+            if self.file_path and clip_srcs:
+                generate_edl(clip_starts, clip_ends, clip_start_frames, clip_end_frames, clip_srcs,
+                             self.file_path, self.compensation_frames)
 
         except KeyboardInterrupt:
             pass
         finally:
-            # Ensure proper disconnection
-            atem.disconnect()
+            # Ensure proper disconnection (a shared switcher session stays open)
+            if owns_atem:
+                atem.disconnect()
             if self.hyperdeck_conn:
-                self.hyperdeck_conn.close()
+                close_hyperdeck(self.hyperdeck_conn)
 
 class ATEMGUI(QWidget):
     def __init__(self):
@@ -285,12 +456,28 @@ class ATEMGUI(QWidget):
 
         self.setLayout(self.layout)
 
+        # Polls the monitoring thread for the timecode while logging
+        self.timecode_timer = QTimer(self)
+        self.timecode_timer.setInterval(TIMECODE_REFRESH_INTERVAL)
+        self.timecode_timer.timeout.connect(self.refresh_timecode)
+
+        # Cuts waiting to be added to the log table, flushed in batches
+        self._pending_rows = []
+        self.log_flush_timer = QTimer(self)
+        self.log_flush_timer.setSingleShot(True)
+        self.log_flush_timer.setInterval(LOG_FLUSH_INTERVAL)
+        self.log_flush_timer.timeout.connect(self.flush_log_table)
+
         self.monitor_thread = None
         self.file_path = None
         self.is_monitoring = False
         self.atem = ATEMMax()
+        # Registered once: PyATEMMax has no way to remove an event handler
+        self.atem.registerEvent(self.atem.atem.events.receive, self.on_atem_receive)
         self.stop_event = threading.Event()
         self.last_program_input = None
+        self._row_of = {}
+        self._current_row = None
 
     def connect_to_atem(self):
         atem_ip = self.ip_input.text()
@@ -304,20 +491,25 @@ class ATEMGUI(QWidget):
             return
 
         try:
-            self.atem.connect(atem_ip)
+            # Keep the current switcher session if it already targets this IP
+            if not (self.atem.connected and self.atem.ip == atem_ip):
+                self.atem.connect(atem_ip)
 
-            inputs = []
-            for video_source_name in dir(self.atem.atem.videoSources):
-                if not video_source_name.startswith("__"):
-                    if video_source_name.lower().startswith('input'):
-                        inputs.append(video_source_name)
+            inputs = input_names(self.atem.atem.videoSources)
 
             self.input_list.clear()
             self.input_list.addItems(inputs)
+            self._row_of = {name: i for i, name in enumerate(inputs)}
+            self._current_row = None
 
         except Exception as e:
             self.show_error("Connection Error", str(e))
 
+    def on_atem_receive(self, params):
+        # Forward switcher events to the running monitoring thread
+        if self.monitor_thread is not None:
+            self.monitor_thread.on_atem_receive(params)
+
     def toggle_frames_input(self):
         """
         Enables or disables the frame compensation input field
@@ -330,10 +522,13 @@ class ATEMGUI(QWidget):
 
     def toggle_monitoring(self):
         if self.is_monitoring:
-            self.stop_event.set()
+            self.monitor_thread.stop()
             self.monitor_thread.wait()
+            self.timecode_timer.stop()
+            self.refresh_timecode()
             self.is_monitoring = False
             self.start_button.setText("Start")
+            self.connect_button.setEnabled(True)
             # Revert to green border
             self.timecode_frame.setStyleSheet("""
                 QFrame {
@@ -352,13 +547,16 @@ class ATEMGUI(QWidget):
                                                     self.stop_event,
                                                     start_time,
                                                     self.file_path,
-                                                    compensation_frames)
+                                                    compensation_frames,
+                                                    atem=self.atem)
             self.monitor_thread.update_input_signal.connect(self.update_current_input)
             self.monitor_thread.update_log_signal.connect(self.update_log_table)
-            self.monitor_thread.update_timecode_signal.connect(self.update_timecode)
             self.monitor_thread.start()
+            self.timecode_timer.start()
             self.is_monitoring = True
             self.start_button.setText("Stop")
+            # The monitoring thread reads the switcher session; don't reconnect it meanwhile
+            self.connect_button.setEnabled(False)
 
             # Red border when logging starts
             self.timecode_frame.setStyleSheet("""
@@ -380,30 +578,50 @@ class ATEMGUI(QWidget):
     def update_current_input(self, input_str):
         self.current_input_label.setText(f"Selected input: {input_str}")
 
-        for i in range(self.input_list.count()):
-            item = self.input_list.item(i)
-            if item.text() == input_str:
-                item.setBackground(QColor(255, 0, 0))
-            else:
-                item.setBackground(QColor(0, 0, 0))
+        if self._current_row is None:
+            # Nothing highlighted yet: reset every row once
+            for i in range(self.input_list.count()):
+                self.input_list.item(i).setBackground(QColor(0, 0, 0))
+        else:
+            # Only the previously highlighted row needs to be reset
+            self.input_list.item(self._current_row).setBackground(QColor(0, 0, 0))
+
+        row = self._row_of.get(input_str)
+        if row is not None:
+            self.input_list.item(row).setBackground(QColor(255, 0, 0))
+            self._current_row = row
 
     def update_log_table(self, src, start, duration):
-        row_position = self.log_table.rowCount()
-        self.log_table.insertRow(row_position)
-        self.log_table.setItem(row_position, 0, QTableWidgetItem(src))
-        self.log_table.setItem(row_position, 1, QTableWidgetItem(start))
-        self.log_table.setItem(row_position, 2, QTableWidgetItem(duration))
+        self._pending_rows.append((src, start, duration))
+        if not self.log_flush_timer.isActive():
+            self.log_flush_timer.start()
+
+    def flush_log_table(self):
+        """
+        Appends all pending cuts to the log table in a single layout pass.
+        """
+        pending, self._pending_rows = self._pending_rows, []
+        if not pending:
+            return
 
-    def update_timecode(self, timecode):
-        # Display the timecode only
-        self.timecode_display.setText(timecode)
+        base = self.log_table.rowCount()
+        self.log_table.setUpdatesEnabled(False)
+        self.log_table.setRowCount(base + len(pending))
+        for row, (src, start, duration) in enumerate(pending, base):
+            self.log_table.setItem(row, 0, QTableWidgetItem(src))
+            self.log_table.setItem(row, 1, QTableWidgetItem(start))
+            self.log_table.setItem(row, 2, QTableWidgetItem(duration))
+        self.log_table.setUpdatesEnabled(True)
+
+    def refresh_timecode(self):
+        # Display the latest timecode published by the monitoring thread
+        timecode = self.monitor_thread.latest_timecode
+        if timecode and timecode != self.timecode_display.text():
+            self.timecode_display.setText(timecode)
 
     def is_valid_ip(self, ip):
-        try:
-            socket.inet_aton(ip)
-            return True
-        except socket.error:
-            return False
+        # Strict dotted-quad check: rejects the short forms inet_aton accepts ("10", "1.2.3")
+        return bool(_IP_RE.fullmatch(ip)) and all(int(octet) < 256 for octet in ip.split("."))
 
     def show_error(self, title, message):
         QMessageBox.critical(self, title, message)
@@ -411,14 +629,24 @@ class ATEMGUI(QWidget):
     def closeEvent(self, event):
         """Handle closing the application properly"""
         if self.is_monitoring:
-            self.stop_event.set()  # Stop monitoring
+            self.monitor_thread.stop()  # Stop monitoring
             self.monitor_thread.wait()  # Wait for the thread to finish
 
+        # The GUI owns the switcher session shared with the monitoring thread
+        self.atem.disconnect()
+
         # Close the application properly after all operations are complete
         event.accept()
 
 if __name__ == "__main__":
-    app = QApplication([])
+    parser = argparse.ArgumentParser(description="ATEM Logger")
+    parser.add_argument("--debug", action="store_true", help="enable debug logging")
+    # Unknown arguments are left to Qt
+    args, qt_args = parser.parse_known_args()
+    if args.debug:
+        logging.getLogger().setLevel(logging.DEBUG)
+
+    app = QApplication(sys.argv[:1] + qt_args)
     window = ATEMGUI()
     window.show()
     app.exec()